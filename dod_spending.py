@@ -1,20 +1,73 @@
 import requests
-from googlesearch import search
-from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from googlesearch import search as google_search
+from urllib.parse import urljoin, urlparse
+import re
+from html import unescape
+import os
+import random
 import time
 import argparse
 import sys
 import logging
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
-from dataclasses import dataclass
-from typing import Dict, Set, Optional
-from concurrent.futures import ThreadPoolExecutor
+from requests.packages.urllib3.exceptions import HTTPError as Urllib3Error
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Set, Optional, TypeVar
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import threading
+import asyncio
+import socket
 import csv
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx reports malformed URLs (bad IDNA hosts, control characters) as InvalidURL or
+# UnicodeError rather than HTTPError; ValueError covers both so they count as "not a PDF".
+HTTP_ERRORS = (requests.RequestException, Urllib3Error) + (
+    (httpx.HTTPError, httpx.InvalidURL, ValueError) if httpx is not None else ())
+
+# aiohttp surfaces malformed hosts (e.g. bad IDNA labels) as UnicodeError from getaddrinfo
+ASYNC_HTTP_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ValueError) if aiohttp is not None else ()
+
+T = TypeVar("T")
+
+# Fetches just the PDF magic bytes; identity encoding keeps the byte range meaningful
+PDF_PROBE_HEADERS = {"Range": "bytes=0-4", "Accept-Encoding": "identity"}
+
+# href of <a> tags whose path ends in .pdf; the query string is kept, only the fragment is dropped
+HREF_PDF = re.compile(
+    rb"""<a\s[^>]*?(?<![\w-])href\s*=\s*["']([^"'#]+?\.pdf(?:\?[^"'#]*)?)(?:#[^"']*)?["']""",
+    re.IGNORECASE
+)
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def non_negative_float(value: str) -> float:
+    number = float(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be zero or greater, got {value}")
+    return number
+
 DEFAULT_QUERIES = {
     "FY 2024 DoD Budget": "DoD budget FY 2024 spending cur filetype:pdf site:*.edu | site:*.org | site:*.gov -inurl:(signup | login)",
     "FY 2025 DoD Budget": "DoD budget FY 2025 spending cur filetype:pdf site:*.edu | site:*.org | site:*.gov -inurl:(signup | login)",
@@ -27,96 +80,548 @@ class Config:
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     max_retries: int = 3
     backoff_factor: float = 1.5
+    backoff_jitter: float = 0.5
     retry_status_codes: tuple = (429, 500, 502, 503, 504)
     search_results_limit: int = 15
-    max_workers: int = 8
+    search_backend: str = "google"
+    query_workers: int = 3
+    url_workers: int = 8
+    head_workers: int = 4
+    pool_size: int = 32
+    verify_pdfs: bool = True
+    http2: bool = False
+    use_cache: bool = True
+    search_cache_path: str = "dod_search_cache.sqlite"
+    search_cache_ttl: timedelta = timedelta(hours=6)
+    pdf_verdict_ttl: timedelta = timedelta(hours=12)
+    domain_requests_per_second: float = 0.0
+    domain_burst: int = 4
+    max_page_bytes: int = 512 * 1024
+    max_page_content_length: int = 5 * 1024 * 1024
+    async_connection_limit: int = 64
+    async_connections_per_host: int = 4
+    dns_cache_ttl: int = 300
+
+@dataclass
+class TokenBucket:
+    rate: float
+    capacity: float
+    tokens: float
+    last_refill: float = field(default_factory=time.monotonic)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must sleep before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+class RateLimiter:
+    """Optional per-domain throttle; disabled while domain_requests_per_second is 0."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.lock = threading.Lock()
+        self.buckets: Dict[str, TokenBucket] = {}
+
+    def wait(self, url: str) -> None:
+        if self.config.domain_requests_per_second <= 0:
+            return
+        delay = self._bucket(url).reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def wait_async(self, url: str) -> None:
+        if self.config.domain_requests_per_second <= 0:
+            return
+        delay = self._bucket(url).reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        domain = urlparse(url).netloc
+        bucket = self.buckets.get(domain)
+        if bucket is None:
+            with self.lock:
+                bucket = self.buckets.setdefault(domain, TokenBucket(
+                    rate=self.config.domain_requests_per_second,
+                    capacity=self.config.domain_burst,
+                    tokens=self.config.domain_burst
+                ))
+        return bucket
+
+class DNSCache:
+    """Caches socket.getaddrinfo answers so repeated requests to a host skip the lookup."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: Dict[tuple, tuple] = {}
+        self._getaddrinfo = socket.getaddrinfo
+
+    def install(self) -> None:
+        socket.getaddrinfo = self.getaddrinfo
+
+    def getaddrinfo(self, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            return entry[1]
+        result = self._getaddrinfo(*args, **kwargs)
+        with self.lock:
+            self.entries[key] = (now, result)
+        return result
+
+class SearchCache:
+    """Persists search-engine result URLs per query and PDF check verdicts per URL across runs."""
+
+    def __init__(self, path: str, ttl: timedelta, verdict_ttl: timedelta):
+        self.ttl = ttl.total_seconds()
+        self.verdict_ttl = verdict_ttl.total_seconds()
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "backend TEXT, query TEXT, fetched_at REAL, urls TEXT, PRIMARY KEY (backend, query))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS pdf_verdicts (url TEXT PRIMARY KEY, is_pdf INTEGER, checked_at REAL)"
+            )
+
+    def get(self, backend: str, query: str) -> Optional[List[str]]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT fetched_at, urls FROM searches WHERE backend = ? AND query = ?", (backend, query)
+            ).fetchone()
+        if row is None or time.time() - row[0] >= self.ttl:
+            return None
+        return json.loads(row[1])
+
+    def set(self, backend: str, query: str, urls: List[str]) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO searches (backend, query, fetched_at, urls) VALUES (?, ?, ?, ?)",
+                (backend, query, time.time(), json.dumps(urls))
+            )
+
+    def get_pdf_verdict(self, url: str) -> Optional[bool]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT is_pdf, checked_at FROM pdf_verdicts WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or time.time() - row[1] >= self.verdict_ttl:
+            return None
+        return bool(row[0])
+
+    def set_pdf_verdict(self, url: str, is_pdf: bool) -> None:
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO pdf_verdicts (url, is_pdf, checked_at) VALUES (?, ?, ?)",
+                (url, int(is_pdf), time.time())
+            )
+
+    def close(self) -> None:
+        self.connection.close()
 
 class SessionManager:
     def __init__(self, config: Config):
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": config.user_agent})
-        retry_strategy = Retry(
+        self.session.headers.update({"User-Agent": config.user_agent, "Connection": "keep-alive"})
+        retry_options = dict(
             total=config.max_retries,
             backoff_factor=config.backoff_factor,
             status_forcelist=config.retry_status_codes,
-            allowed_methods=["HEAD", "GET"]
+            allowed_methods=["HEAD", "GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        try:
+            retry_strategy = Retry(backoff_jitter=config.backoff_jitter, **retry_options)
+        except TypeError:
+            # backoff_jitter was added in urllib3 2.0
+            retry_strategy = Retry(**retry_options)
+        adapter = HTTPAdapter(
+            pool_connections=config.pool_size,
+            pool_maxsize=config.pool_size,
+            pool_block=False,
+            max_retries=retry_strategy
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        if not isinstance(getattr(socket.getaddrinfo, "__self__", None), DNSCache):
+            DNSCache(config.dns_cache_ttl).install()
+
+    @staticmethod
+    def create_http2_client(config: Config) -> "httpx.Client":
+        return httpx.Client(
+            http2=True,
+            headers={"User-Agent": config.user_agent},
+            limits=httpx.Limits(max_connections=config.pool_size, max_keepalive_connections=config.pool_size)
+        )
+
+class SearchBackend(ABC):
+    name: str
+
+    def __init__(self, session: requests.Session, config: Config):
+        self.session = session
+        self.config = config
+
+    @abstractmethod
+    def search(self, query: str, limit: int) -> List[str]:
+        """Return up to limit result URLs for query."""
+
+class GoogleBackend(SearchBackend):
+    name = "google"
+
+    def search(self, query: str, limit: int) -> List[str]:
+        return list(google_search(query, num_results=limit))
+
+class SerpApiBackend(SearchBackend):
+    name = "serpapi"
+    endpoint = "https://serpapi.com/search.json"
 
-class PDFSearcher:
     def __init__(self, session: requests.Session, config: Config):
+        super().__init__(session, config)
+        self.api_key = os.environ.get("SERPAPI_API_KEY")
+        if not self.api_key:
+            raise ValueError("SERPAPI_API_KEY is not set")
+
+    def search(self, query: str, limit: int) -> List[str]:
+        response = self.session.get(
+            self.endpoint,
+            params={"engine": "google", "q": query, "num": limit, "api_key": self.api_key},
+            timeout=self.config.timeout
+        )
+        response.raise_for_status()
+        return [result["link"] for result in response.json().get("organic_results", [])][:limit]
+
+SEARCH_BACKENDS = {backend.name: backend for backend in (GoogleBackend, SerpApiBackend)}
+
+class PDFSearcher:
+    def __init__(self, session: requests.Session, config: Config, backend: Optional[SearchBackend] = None,
+                 search_cache: Optional[SearchCache] = None):
         self.session = session
         self.config = config
+        self.backend = backend if backend is not None else GoogleBackend(session, config)
+        self.search_cache = search_cache
         self.lock = threading.Lock()
-        self.cache = set()
+        self.cache: Dict[str, Set[str]] = {}
+        self.checked_pdfs: Dict[str, Future] = {}
+        self.rate_limiter = RateLimiter(config)
+        self.pdf_client = None
+        self.search_executor = ThreadPoolExecutor(max_workers=config.query_workers)
+        self.executor = ThreadPoolExecutor(max_workers=config.url_workers)
+        self.head_executor = ThreadPoolExecutor(max_workers=config.head_workers)
 
-    def find_pdf_links(self, query: str, verbose: bool = False) -> Set[str]:
-        pdf_links = set()
+    def close(self) -> None:
+        for executor in (self.search_executor, self.executor, self.head_executor):
+            executor.shutdown(wait=True)
+        if self.pdf_client is not None:
+            self.pdf_client.close()
+        if self.search_cache is not None:
+            self.search_cache.close()
+
+    def search(self, query: str, verbose: bool = False) -> List[str]:
+        if self.search_cache is not None:
+            cached = self.search_cache.get(self.backend.name, query)
+            if cached is not None:
+                if verbose:
+                    logging.info(f"Using cached results: {query}")
+                return cached
         if verbose:
             logging.info(f"Searching: {query}")
         try:
-            search_results = list(search(query, num_results=self.config.search_results_limit))
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                executor.map(lambda url: self._process_url(url, pdf_links, verbose), search_results)
+            urls = self.backend.search(query, self.config.search_results_limit)
         except Exception as e:
             logging.error(f"Search failed for '{query}': {e}")
-        return pdf_links
+            return []
+        # An empty list usually means the engine blocked or served a consent page; don't pin it
+        if urls and self.search_cache is not None:
+            self.search_cache.set(self.backend.name, query, urls)
+        return urls
 
-    def _process_url(self, url: str, pdf_links: Set[str], verbose: bool) -> None:
+    def find_pdf_links(self, urls: Iterable[str], verbose: bool = False) -> Dict[str, Set[str]]:
+        urls = list(dict.fromkeys(urls))
         with self.lock:
-            if url in self.cache:
-                return
-            self.cache.add(url)
+            pending = [url for url in urls if url not in self.cache]
+        page_candidates = self._map_by_host(self.executor, self.config.url_workers,
+                                            lambda url: self._process_url(url, verbose), pending, set())
+        # Candidates are verified here rather than from inside _process_url so
+        # pool workers never block waiting on other queued tasks.
+        pdf_candidates = list(dict.fromkeys(pdf for found in page_candidates.values() for pdf in found))
+        verdicts = self._map_by_host(self.head_executor, self.config.head_workers,
+                                     lambda pdf_url: self._check_direct_pdf(pdf_url, verbose), pdf_candidates, False)
+        verified = {pdf for pdf, is_pdf in verdicts.items() if is_pdf}
+        with self.lock:
+            for url, found in page_candidates.items():
+                self.cache[url] = found & verified
+            return {url: self.cache.get(url, set()) for url in urls}
+
+    @staticmethod
+    def _map_by_host(executor: ThreadPoolExecutor, workers: int, fn: Callable[[str], T],
+                     urls: Iterable[str], default: T) -> Dict[str, T]:
+        # Each host's URLs are split into at most `workers` chunks that run one URL
+        # after another, so consecutive requests reuse a kept-alive connection while
+        # a single busy host can still use the whole stage (and multiplex on HTTP/2).
+        by_host = defaultdict(list)
+        for url in urls:
+            by_host[urlparse(url).netloc].append(url)
+        chunks = [bucket[i::min(workers, len(bucket))] for bucket in by_host.values()
+                  for i in range(min(workers, len(bucket)))]
+        futures = [executor.submit(PDFSearcher._process_bucket, fn, chunk, default) for chunk in chunks]
+        results = {}
+        for future in futures:
+            results.update(future.result())
+        return results
+
+    @staticmethod
+    def _process_bucket(fn: Callable[[str], T], bucket: List[str], default: T) -> Dict[str, T]:
+        results = {}
+        for url in bucket:
+            try:
+                results[url] = fn(url)
+            except Exception as e:
+                logging.debug(f"Error processing {url}: {e}")
+                results[url] = default
+        return results
+
+    def _process_url(self, url: str, verbose: bool) -> Set[str]:
         try:
             if url.endswith(".pdf"):
-                self._check_direct_pdf(url, pdf_links, verbose)
-            else:
-                self._scrape_page_for_pdfs(url, pdf_links, verbose)
+                return {url}
+            return self._scrape_page_for_pdfs(url, verbose)
         except Exception as e:
             if verbose:
                 logging.debug(f"Error processing {url}: {e}")
+        return set()
 
-    def _check_direct_pdf(self, url: str, pdf_links: Set[str], verbose: bool) -> None:
+    def _check_direct_pdf(self, url: str, verbose: bool) -> bool:
+        if not self.config.verify_pdfs and self._is_trusted_pdf_url(url):
+            return True
+        # setdefault claims the URL atomically; concurrent callers wait on the first probe
+        verdict = Future()
+        existing = self.checked_pdfs.setdefault(url, verdict)
+        if existing is not verdict:
+            return existing.result()
+        cached = self.search_cache.get_pdf_verdict(url) if self.search_cache is not None else None
+        if cached is not None:
+            verdict.set_result(cached)
+            return cached
+        is_pdf = False
+        status = None
         try:
-            response = self.session.head(url, timeout=self.config.timeout, allow_redirects=True)
-            if response.status_code == 200 and "application/pdf" in response.headers.get("Content-Type", ""):
-                with self.lock:
-                    pdf_links.add(url)
-                if verbose:
-                    logging.debug(f"Found PDF: {url}")
-        except requests.RequestException:
+            self.rate_limiter.wait(url)
+            if self.pdf_client is not None:
+                response, prefix = self._probe_http2(url)
+            else:
+                with self.session.get(url, headers=PDF_PROBE_HEADERS, timeout=self.config.timeout,
+                                      stream=True) as response:
+                    prefix = response.raw.read(5)
+            status = response.status_code
+            is_pdf = self._is_pdf_response(status, response.headers, prefix)
+            if is_pdf and verbose:
+                logging.debug(f"Found PDF: {url}")
+        except HTTP_ERRORS:
             pass
+        finally:
+            verdict.set_result(is_pdf)
+        # Only a definite answer is persisted; errors and throttled/5xx replies are retried next run
+        if self.search_cache is not None and status is not None and status not in self.config.retry_status_codes:
+            self.search_cache.set_pdf_verdict(url, is_pdf)
+        return is_pdf
+
+    def _probe_http2(self, url: str):
+        # httpx has no equivalent of the session's urllib3 Retry, so apply the same policy here:
+        # retry transport errors and retry_status_codes, honouring Retry-After when present.
+        for attempt in range(self.config.max_retries + 1):
+            last_attempt = attempt == self.config.max_retries
+            try:
+                with self.pdf_client.stream("GET", url, headers=PDF_PROBE_HEADERS, timeout=self.config.timeout,
+                                            follow_redirects=True) as response:
+                    prefix = next(response.iter_raw(5), b"")
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                continue
+            if last_attempt or response.status_code not in self.config.retry_status_codes:
+                return response, prefix
+            retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+            time.sleep(retry_after if retry_after is not None else self._backoff_delay(attempt))
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return self.config.backoff_factor * (2 ** attempt) + random.uniform(0, self.config.backoff_jitter)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
-    def _scrape_page_for_pdfs(self, url: str, pdf_links: Set[str], verbose: bool) -> None:
+    def _scrape_page_for_pdfs(self, url: str, verbose: bool) -> Set[str]:
         try:
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            pdf_urls = {urljoin(url, link["href"]) for link in soup.find_all("a", href=True) 
-                       if link["href"].endswith(".pdf")}
-            with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-                executor.map(lambda pdf_url: self._check_direct_pdf(pdf_url, pdf_links, verbose), pdf_urls)
+            self.rate_limiter.wait(url)
+            with self.session.get(url, timeout=self.config.timeout, stream=True) as response:
+                response.raise_for_status()
+                if not self._is_scrapable_page(response.headers, self.config.max_page_content_length):
+                    return set()
+                # PDF anchors almost always appear early, so only the head of the page is read
+                html = response.raw.read(self.config.max_page_bytes, decode_content=True)
+            return self._extract_pdf_urls(url, html)
         except requests.RequestException:
+            return set()
+
+    @staticmethod
+    def _is_trusted_pdf_url(url: str) -> bool:
+        parsed = urlparse(url)
+        return parsed.path.lower().endswith(".pdf") and (parsed.hostname or "").endswith(".gov")
+
+    @staticmethod
+    def _is_pdf_response(status_code: int, headers, prefix: bytes) -> bool:
+        if status_code not in (200, 206):
+            return False
+        return prefix.startswith(b"%PDF") or headers.get("Content-Type", "").startswith("application/pdf")
+
+    @staticmethod
+    def _is_scrapable_page(headers, max_content_length: int) -> bool:
+        content_type = headers.get("Content-Type", "")
+        if "text/html" not in content_type and "application/xhtml+xml" not in content_type:
+            return False
+        content_length = headers.get("Content-Length", "")
+        return not content_length.isdigit() or int(content_length) <= max_content_length
+
+    @staticmethod
+    def _extract_pdf_urls(url: str, html: bytes) -> Set[str]:
+        return {urljoin(url, unescape(href.decode("utf-8", "ignore"))) for href in HREF_PDF.findall(html)}
+
+class AsyncPDFSearcher:
+    """Coroutine counterpart of PDFSearcher's scraping stage, used with --async."""
+
+    def __init__(self, config: Config, search_cache: Optional[SearchCache] = None):
+        self.config = config
+        self.search_cache = search_cache
+        self.cache: Dict[str, Set[str]] = {}
+        self.checked_pdfs: Dict[str, asyncio.Future] = {}
+        self.rate_limiter = RateLimiter(config)
+
+    def find_pdf_links(self, urls: Iterable[str], verbose: bool = False) -> Dict[str, Set[str]]:
+        return asyncio.run(self._find_pdf_links(list(dict.fromkeys(urls)), verbose))
+
+    async def _find_pdf_links(self, urls: List[str], verbose: bool) -> Dict[str, Set[str]]:
+        self.semaphore = asyncio.Semaphore(self.config.url_workers)
+        self.head_semaphore = asyncio.Semaphore(self.config.head_workers)
+        connector = aiohttp.TCPConnector(
+            limit=self.config.async_connection_limit,
+            limit_per_host=self.config.async_connections_per_host,
+            ttl_dns_cache=self.config.dns_cache_ttl
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": self.config.user_agent},
+            timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+        ) as self.session:
+            pending = [url for url in urls if url not in self.cache]
+            found = await asyncio.gather(*(self._process_url(url, verbose) for url in pending), return_exceptions=True)
+            page_candidates = dict(zip(pending, self._without_failures(pending, found, set())))
+            pdf_candidates = list(dict.fromkeys(pdf for found in page_candidates.values() for pdf in found))
+            verdicts = await asyncio.gather(*(self._check_direct_pdf(pdf_url, verbose) for pdf_url in pdf_candidates),
+                                            return_exceptions=True)
+        verdicts = self._without_failures(pdf_candidates, verdicts, False)
+        verified = {pdf for pdf, is_pdf in zip(pdf_candidates, verdicts) if is_pdf}
+        for url, found in page_candidates.items():
+            self.cache[url] = found & verified
+        return {url: self.cache.get(url, set()) for url in urls}
+
+    @staticmethod
+    def _without_failures(urls: List[str], results: list, default: T) -> List[T]:
+        # Mirrors PDFSearcher._process_bucket: one URL's failure must not end the run
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logging.debug(f"Error processing {url}: {result}")
+        return [default if isinstance(result, Exception) else result for result in results]
+
+    async def _process_url(self, url: str, verbose: bool) -> Set[str]:
+        try:
+            if url.endswith(".pdf"):
+                return {url}
+            return await self._scrape_page_for_pdfs(url, verbose)
+        except Exception as e:
+            if verbose:
+                logging.debug(f"Error processing {url}: {e}")
+        return set()
+
+    async def _check_direct_pdf(self, url: str, verbose: bool) -> bool:
+        if not self.config.verify_pdfs and PDFSearcher._is_trusted_pdf_url(url):
+            return True
+        verdict = asyncio.get_running_loop().create_future()
+        existing = self.checked_pdfs.setdefault(url, verdict)
+        if existing is not verdict:
+            return await existing
+        cached = self.search_cache.get_pdf_verdict(url) if self.search_cache is not None else None
+        if cached is not None:
+            verdict.set_result(cached)
+            return cached
+        is_pdf = False
+        status = None
+        try:
+            await self.rate_limiter.wait_async(url)
+            async with self.head_semaphore:
+                async with self.session.get(url, headers=PDF_PROBE_HEADERS, allow_redirects=True) as response:
+                    prefix = await response.content.read(5)
+                    status = response.status
+                    is_pdf = PDFSearcher._is_pdf_response(status, response.headers, prefix)
+            if is_pdf and verbose:
+                logging.debug(f"Found PDF: {url}")
+        except ASYNC_HTTP_ERRORS:
             pass
+        finally:
+            verdict.set_result(is_pdf)
+        if self.search_cache is not None and status is not None and status not in self.config.retry_status_codes:
+            self.search_cache.set_pdf_verdict(url, is_pdf)
+        return is_pdf
+
+    async def _scrape_page_for_pdfs(self, url: str, verbose: bool) -> Set[str]:
+        try:
+            await self.rate_limiter.wait_async(url)
+            async with self.semaphore:
+                async with self.session.get(url, raise_for_status=True) as response:
+                    if not PDFSearcher._is_scrapable_page(response.headers, self.config.max_page_content_length):
+                        return set()
+                    html = bytearray()
+                    async for chunk in response.content.iter_any():
+                        html += chunk
+                        if len(html) >= self.config.max_page_bytes:
+                            break
+            html = bytes(html[:self.config.max_page_bytes])
+            return PDFSearcher._extract_pdf_urls(url, html)
+        except ASYNC_HTTP_ERRORS:
+            return set()
 
 class FileHandler:
     @staticmethod
     def save_results(filename: str, search_results: Dict[str, Set[str]]) -> None:
         try:
-            with Path(filename).open("w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Search Performed On", time.ctime()])
-                writer.writerow([])
-                writer.writerow(["Query", "PDF Link"])
-                total_pdfs = 0
-                for title, links in search_results.items():
-                    for link in sorted(links):
-                        writer.writerow([title, link])
-                    total_pdfs += len(links)
-                    writer.writerow([])
-                writer.writerow(["Total PDFs Found", total_pdfs])
+            rows = [["Search Performed On", time.ctime()], [], ["Query", "PDF Link"]]
+            for title, links in search_results.items():
+                rows.extend([title, link] for link in sorted(links))
+                rows.append([])
+            rows.append(["Total PDFs Found", sum(len(links) for links in search_results.values())])
+            with Path(filename).open("w", newline="", encoding="utf-8", buffering=1024 * 1024) as f:
+                csv.writer(f).writerows(rows)
             logging.info(f"Results saved to {filename}")
         except IOError as e:
             logging.error(f"Failed to save results to {filename}: {e}")
@@ -124,13 +629,36 @@ class FileHandler:
 class SearchApplication:
     def __init__(self):
         self.config = Config()
-        self.session_manager = SessionManager(self.config)
-        self.searcher = PDFSearcher(self.session_manager.session, self.config)
 
     def run(self) -> None:
         args = self._parse_args()
         self._setup_logging(args.verbose)
-        search_results = self._perform_searches(args)
+        self.config.verify_pdfs = not args.fast
+        self.config.http2 = args.http2
+        self.config.use_cache = not args.no_cache
+        self.config.search_backend = args.backend
+        self.config.query_workers = args.query_workers
+        self.config.url_workers = args.url_workers
+        self.config.head_workers = args.head_workers
+        self.config.domain_requests_per_second = args.domain_rps
+        self.config.domain_burst = args.domain_burst
+        self.session_manager = SessionManager(self.config)
+        session = self.session_manager.session
+        try:
+            backend = SEARCH_BACKENDS[self.config.search_backend](session, self.config)
+        except ValueError as e:
+            logging.error(f"Cannot use the {self.config.search_backend} search backend: {e}")
+            sys.exit(1)
+        search_cache = SearchCache(
+            self.config.search_cache_path, self.config.search_cache_ttl, self.config.pdf_verdict_ttl
+        ) if self.config.use_cache else None
+        self.searcher = PDFSearcher(session, self.config, backend, search_cache)
+        if self.config.http2:
+            self.searcher.pdf_client = self._create_http2_client()
+        try:
+            search_results = self._perform_searches(args)
+        finally:
+            self.searcher.close()
         self._save_results(args.output, search_results)
 
     def _parse_args(self) -> argparse.Namespace:
@@ -138,6 +666,25 @@ class SearchApplication:
         parser.add_argument("-o", "--output", type=str, default=None)
         parser.add_argument("-v", "--verbose", action="store_true")
         parser.add_argument("-q", "--queries", nargs="*", type=str)
+        parser.add_argument("--fast", action="store_true", help="Accept .pdf URLs on .gov hosts without fetching them to check")
+        parser.add_argument("--async", dest="use_async", action="store_true",
+                            help="Scrape result pages with asyncio/aiohttp instead of threads")
+        parser.add_argument("--http2", action="store_true",
+                            help="Send PDF checks over HTTP/2 with httpx (threaded mode only)")
+        parser.add_argument("--backend", choices=sorted(SEARCH_BACKENDS), default=self.config.search_backend,
+                            help="Search provider (serpapi reads SERPAPI_API_KEY)")
+        parser.add_argument("--query-workers", type=positive_int, default=self.config.query_workers,
+                            help="Searches run concurrently")
+        parser.add_argument("--url-workers", type=positive_int, default=self.config.url_workers,
+                            help="Result pages fetched concurrently")
+        parser.add_argument("--head-workers", type=positive_int, default=self.config.head_workers,
+                            help="PDF checks run concurrently; keep low to respect per-host rate limits")
+        parser.add_argument("--domain-rps", type=non_negative_float, default=self.config.domain_requests_per_second,
+                            help="Throttle requests to each domain to this rate; 0 (default) disables throttling")
+        parser.add_argument("--domain-burst", type=positive_int, default=self.config.domain_burst,
+                            help="Requests allowed back-to-back per domain before --domain-rps applies")
+        parser.add_argument("--no-cache", action="store_true",
+                            help="Ignore and do not update the on-disk search and HTTP caches")
         return parser.parse_args()
 
     def _setup_logging(self, verbose: bool) -> None:
@@ -147,6 +694,7 @@ class SearchApplication:
             handlers=[logging.StreamHandler(sys.stdout)],
             force=True
         )
+        logging.getLogger("httpx").setLevel(logging.WARNING)
 
     def _get_queries(self, args: argparse.Namespace) -> Dict[str, str]:
         if not args.queries:
@@ -163,24 +711,51 @@ class SearchApplication:
 
     def _perform_searches(self, args: argparse.Namespace) -> Dict[str, Set[str]]:
         queries = self._get_queries(args)
+        query_urls = {}
+        future_to_title = {self.searcher.search_executor.submit(self.searcher.search, query, args.verbose): title 
+                          for title, query in queries.items()}
+        for future in as_completed(future_to_title):
+            title = future_to_title[future]
+            try:
+                query_urls[title] = future.result()
+                if args.verbose:
+                    logging.info(f"Search complete: {title} ({len(query_urls[title])} results)")
+            except Exception as e:
+                logging.error(f"Failed to process {title}: {e}")
+        unique_urls = dict.fromkeys(url for urls in query_urls.values() for url in urls)
+        pdfs_by_url = self._get_page_searcher(args).find_pdf_links(unique_urls, args.verbose)
         search_results = {}
-        with ThreadPoolExecutor(max_workers=min(len(queries), self.config.max_workers)) as executor:
-            future_to_title = {executor.submit(self.searcher.find_pdf_links, query, args.verbose): title 
-                              for title, query in queries.items()}
-            for future in future_to_title:
-                title = future_to_title[future]
-                logging.info(f"{title}")
-                try:
-                    pdf_links = future.result()
-                    search_results[title] = pdf_links
-                    for index, pdf in enumerate(sorted(pdf_links), 1):
-                        logging.info(f"[{index}] {pdf}")
-                    if not pdf_links:
-                        logging.info("No PDFs found")
-                except Exception as e:
-                    logging.error(f"Failed to process {title}: {e}")
+        for title in queries:
+            if title not in query_urls:
+                continue
+            urls = query_urls[title]
+            logging.info(f"{title}")
+            pdf_links = set().union(*(pdfs_by_url[url] for url in urls))
+            search_results[title] = pdf_links
+            for index, pdf in enumerate(sorted(pdf_links), 1):
+                logging.info(f"[{index}] {pdf}")
+            if not pdf_links:
+                logging.info("No PDFs found")
         return search_results
 
+    def _create_http2_client(self) -> "httpx.Client":
+        if httpx is None:
+            logging.error("--http2 requires httpx (pip install 'httpx[http2]')")
+            sys.exit(1)
+        try:
+            return SessionManager.create_http2_client(self.config)
+        except ImportError as e:
+            logging.error(f"--http2 requires the h2 package: {e}")
+            sys.exit(1)
+
+    def _get_page_searcher(self, args: argparse.Namespace):
+        if not args.use_async:
+            return self.searcher
+        if aiohttp is None:
+            logging.error("--async requires aiohttp (pip install aiohttp)")
+            sys.exit(1)
+        return AsyncPDFSearcher(self.config, self.searcher.search_cache)
+
     def _save_results(self, output: Optional[str], search_results: Dict[str, Set[str]]) -> None:
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = output if output else f"dod_spending_pdfs_{timestamp}.csv"